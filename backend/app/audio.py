@@ -0,0 +1,67 @@
+import asyncio
+from asyncio.subprocess import PIPE, Process
+
+FFMPEG_TO_WAV = (
+    "ffmpeg", "-loglevel", "error", "-threads", "2",
+    "-i", "pipe:0",
+    "-f", "wav", "-acodec", "pcm_s16le", "-ar", "16000", "-ac", "1",
+    "pipe:1",
+)
+
+
+class FfmpegPool:
+    def __init__(self, size: int = 2) -> None:
+        self.size = size
+        self._idle: asyncio.Queue[Process] = asyncio.Queue()
+        self._refills: set[asyncio.Task] = set()
+
+    async def start(self) -> None:
+        # Spawn processes ahead of time so requests skip fork/exec and
+        # ffmpeg's startup; each one still converts a single input.
+        for _ in range(self.size):
+            try:
+                await self._idle.put(await self._spawn())
+            except OSError:
+                # ffmpeg missing: convert() reports it per request instead.
+                return
+
+    async def close(self) -> None:
+        for task in self._refills:
+            task.cancel()
+        while not self._idle.empty():
+            proc = self._idle.get_nowait()
+            if proc.returncode is None:
+                proc.kill()
+            await proc.wait()
+
+    async def convert(self, data: bytes) -> bytes:
+        # Resample to 16 kHz mono up front so Whisper does not have to.
+        proc = await self._acquire()
+        wav, err = await proc.communicate(data)
+        if proc.returncode != 0:
+            raise RuntimeError(err.decode(errors="replace").strip() or f"ffmpeg exited with {proc.returncode}")
+        return wav
+
+    async def _acquire(self) -> Process:
+        while not self._idle.empty():
+            proc = self._idle.get_nowait()
+            self._schedule_refill()
+            if proc.returncode is None:
+                return proc
+        return await self._spawn()
+
+    def _schedule_refill(self) -> None:
+        task = asyncio.create_task(self._refill())
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
+
+    async def _refill(self) -> None:
+        try:
+            await self._idle.put(await self._spawn())
+        except OSError:
+            pass
+
+    async def _spawn(self) -> Process:
+        return await asyncio.create_subprocess_exec(
+            *FFMPEG_TO_WAV, stdin=PIPE, stdout=PIPE, stderr=PIPE
+        )
@@ -1,11 +1,29 @@
 import os
 from pathlib import Path
 
+import httpx
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import APIError, AsyncOpenAI, OpenAIError
 
 load_dotenv(Path(__file__).resolve().parents[2] / ".env")
 
+# Same CA bundle httpx would pick (certifi, or SSL_CERT_FILE/SSL_CERT_DIR),
+# loaded once and reused by every client create_http_client() builds.
+_SSL_CTX = httpx.create_ssl_context()
+
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=128,
+    keepalive_expiry=30,
+)
+
+TRANSLATION_SYSTEM_PROMPT = "You are a helpful translation assistant."
+TRANSLATION_INSTRUCTION = (
+    "Translate the text into the target language and return only the "
+    "translation without reasoning."
+)
+
 
 def _require_env(name: str) -> str:
     value = os.environ.get(name)
@@ -14,30 +32,64 @@ def _require_env(name: str) -> str:
     return value
 
 
+def _translation_messages(text: str, target_language: str) -> list[dict]:
+    # All fixed wording comes before both variables, so every request shares
+    # the same prompt prefix in vLLM's prefix cache, whatever the language.
+    return [
+        {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT},
+        {"role": "user", "content": f"{TRANSLATION_INSTRUCTION}\nTarget language: {target_language}\nText: {text}"},
+    ]
+
+
+def create_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(verify=_SSL_CTX, limits=HTTP_LIMITS, timeout=3600)
+
+
 class WhisperClient:
     def __init__(
         self,
         base_url: str | None = None,
         model_name: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         base_url = base_url or _require_env("WHISPER_BASE_URL")
         model_name = model_name or _require_env("WHISPER_MODEL")
         if base_url.endswith("/v1"):
             base_url = base_url[:-3]
-        self.client = OpenAI(api_key="EMPTY", base_url=f"{base_url}/v1", timeout=3600)
+        self._http = http_client or create_http_client()
+        self.client = AsyncOpenAI(
+            api_key="EMPTY",
+            base_url=f"{base_url}/v1",
+            timeout=3600,
+            http_client=self._http,
+        )
         self.model_name = model_name
 
-    def transcribe(self, file_input) -> str:
+    async def warmup(self) -> None:
+        # Open a pooled connection early; the server may not be up yet.
+        try:
+            await self.client.with_options(max_retries=0, timeout=5).models.list()
+        except OpenAIError:
+            pass
+
+    async def transcribe(self, file_input) -> str:
         if isinstance(file_input, (str, os.PathLike)):
             with open(file_input, "rb") as f:
-                resp = self.client.audio.transcriptions.create(
+                resp = await self.client.audio.transcriptions.create(
                     model=self.model_name,
                     file=f,
                 )
             return resp.text
 
+        if isinstance(file_input, tuple):
+            # (filename, bytes, content_type) goes straight into the multipart body.
+            resp = await self.client.audio.transcriptions.create(
+                model=self.model_name, file=file_input
+            )
+            return resp.text
+
         file_input.seek(0)
-        resp = self.client.audio.transcriptions.create(
+        resp = await self.client.audio.transcriptions.create(
             model=self.model_name, file=file_input
         )
         return resp.text
@@ -48,34 +100,61 @@ class GemmaClient:
         self,
         base_url: str | None = None,
         model_name: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         base_url = base_url or _require_env("GEMMA_BASE_URL")
         model_name = model_name or _require_env("GEMMA_MODEL")
         if base_url.endswith("/v1"):
             base_url = base_url[:-3]
-        self.client = OpenAI(api_key="EMPTY", base_url=f"{base_url}/v1", timeout=3600)
+        self.base_url = base_url
+        self._http = http_client or create_http_client()
+        self.client = AsyncOpenAI(
+            api_key="EMPTY",
+            base_url=f"{base_url}/v1",
+            timeout=3600,
+            http_client=self._http,
+        )
         self.model_name = model_name
 
-    def translate(self, text: str, target_language: str) -> str:
-        messages = [
-            {"role": "system", "content": [{"type": "text", "text": "You are a helpful translation assistant."}]},
-            {"role": "user", "content": [{"type": "text", "text": f"Translate the following text to {target_language} just return the translation without reasoning. Text: {text}"}]},
-        ]
-        resp = self.client.chat.completions.create(model=self.model_name, messages=messages)
-        return resp.choices[0].message.content
+    async def warmup(self) -> None:
+        # Open a pooled connection early; the server may not be up yet.
+        try:
+            await self.client.with_options(max_retries=0, timeout=5).models.list()
+        except OpenAIError:
+            pass
 
-    def translate_stream(self, text: str, target_language: str):
-        messages = [
-            {"role": "system", "content": [{"type": "text", "text": "You are a helpful translation assistant."}]},
-            {"role": "user", "content": [{"type": "text", "text": f"Translate the following text to {target_language} just return the translation without reasoning. Text: {text}"}]},
-        ]
-        stream = self.client.chat.completions.create(
-            model=self.model_name,
-            messages=messages,
-            stream=True,
-        )
-        for chunk in stream:
-            delta = chunk.choices[0].delta
-            if delta and delta.content:
-                yield delta.content
+    async def translate(self, text: str, target_language: str) -> str:
+        messages = _translation_messages(text, target_language)
+        resp = await self.client.chat.completions.create(model=self.model_name, messages=messages)
+        return resp.choices[0].message.content
 
+    async def translate_stream(self, text: str, target_language: str):
+        messages = _translation_messages(text, target_language)
+        payload = {"model": self.model_name, "messages": messages, "stream": True}
+        # Read the SSE stream directly instead of building SDK objects per token.
+        # Unlike the SDK, this path does not retry failed connections.
+        async with self._http.stream(
+            "POST", f"{self.base_url}/v1/chat/completions", json=payload
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[len("data: "):]
+                if data == "[DONE]":
+                    break
+                frame = orjson.loads(data)
+                error = frame.get("error")
+                if error:
+                    message = error.get("message") if isinstance(error, dict) else None
+                    raise APIError(
+                        message or "An error occurred during streaming",
+                        resp.request,
+                        body=error,
+                    )
+                choices = frame.get("choices")
+                if not choices:
+                    continue
+                content = (choices[0].get("delta") or {}).get("content")
+                if content:
+                    yield content
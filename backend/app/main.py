@@ -1,10 +1,10 @@
-from io import BytesIO
+import asyncio
 
 from fastapi import FastAPI, File, Form, HTTPException, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
-from pydub import AudioSegment
-from app.clients import GemmaClient, WhisperClient
+from app.audio import FfmpegPool
+from app.clients import GemmaClient, WhisperClient, create_http_client
 
 app = FastAPI(title="Translation")
 
@@ -16,28 +16,40 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-whisper_client = WhisperClient()
-gemma_client = GemmaClient()
+http_client = create_http_client()
+whisper_client = WhisperClient(http_client=http_client)
+gemma_client = GemmaClient(http_client=http_client)
+
+ffmpeg_pool = FfmpegPool()
+
+
+@app.on_event("startup")
+async def warm_up() -> None:
+    await asyncio.gather(whisper_client.warmup(), gemma_client.warmup(), ffmpeg_pool.start())
+
+
+@app.on_event("shutdown")
+async def shut_down() -> None:
+    await ffmpeg_pool.close()
+    await http_client.aclose()
+
 
 @app.post("/transcribe")
 async def transcribe(audio: UploadFile = File(...)):
     data = await audio.read()
-    file_obj = BytesIO(data)
-
     content_type = (audio.content_type or "").split(";")[0]
+    upload = (audio.filename or "upload.bin", data, content_type or "application/octet-stream")
+
     if content_type in {"audio/webm", "audio/ogg", "audio/opus"} or (
         audio.filename and audio.filename.endswith((".webm", ".ogg", ".opus"))
     ):
         try:
-            buf = BytesIO()
-            AudioSegment.from_file(BytesIO(data)).export(buf, format="wav")  # let ffmpeg detect
-            buf.seek(0)
-            file_obj = buf
+            upload = ("audio.wav", await ffmpeg_pool.convert(data), "audio/wav")
         except Exception as exc:
             raise HTTPException(status_code=400, detail=f"Could not convert audio: {exc}")
 
     try:
-        text = whisper_client.transcribe(file_obj)
+        text = await whisper_client.transcribe(upload)
         return {"text": text}
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Transcription failed: {exc}")
@@ -50,8 +62,8 @@ async def translate(
     if not text.strip():
         raise HTTPException(status_code=400, detail="Text cannot be empty.")
     try:
-        def generate():
-            for chunk in gemma_client.translate_stream(text=text, target_language=target_language):
+        async def generate():
+            async for chunk in gemma_client.translate_stream(text=text, target_language=target_language):
                 yield chunk
 
         return StreamingResponse(generate(), media_type="text/plain; charset=utf-8")